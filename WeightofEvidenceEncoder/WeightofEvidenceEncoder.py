@@ -2,6 +2,118 @@
 
 import pandas as pd
 import numpy as np
+from joblib import Parallel, delayed
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+# added to the event and non event counts of every category so that
+# categories seen in only one class still get a finite weight of evidence
+_ZERO_ADJUSTMENT = 0.5
+
+# upper bounds of the information value for each predictive power description
+_IV_BOUNDS = np.array([0.02, 0.1, 0.3, 0.5])
+_IV_DESCRIPTIONS = np.array(
+    [
+        "Not useful for prediction",
+        "Weak predictive power",
+        "Medium predictive power",
+        "Strong predictive power",
+        "Too good to be true!",
+    ]
+)
+
+# integer features spanning fewer values than this are offset instead of hashed
+_MAX_INTEGER_RANGE = 1024
+
+
+def _factorize(values):
+    """
+    Encode a feature as int32 codes, like pd.factorize
+
+    Integer features spanning fewer than `_MAX_INTEGER_RANGE` values are
+    offset by their minimum instead of being hashed, so their `uniques`
+    cover the whole range, including values that never occur.
+
+    Parameters
+    ----------
+        values : np.ndarray
+            a feature variable
+
+    Returns
+    -------
+        codes : np.ndarray
+            index of each value in `uniques`, -1 for missing values
+        uniques : np.ndarray
+            categories of the feature
+    """
+    if isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.integer) and values.size:
+        dtype = values.dtype
+        if dtype.itemsize < 4:
+            values = values.astype(np.int32)
+        min_value = values.min()
+        K = int(values.max()) - int(min_value) + 1
+        if K <= _MAX_INTEGER_RANGE:
+            codes = (values - min_value).astype(np.int32, copy=False)
+            uniques = (min_value + np.arange(K, dtype=values.dtype)).astype(dtype)
+            return codes, uniques
+    codes, uniques = pd.factorize(values, sort=False)
+    return codes.astype(np.int32, copy=False), uniques
+
+
+@njit(cache=True, nogil=True)
+def _woe_iv_kernel(codes, y, K):
+    """
+    Calculates weight of evidence and information value in one pass
+
+    Parameters
+    ----------
+        codes : np.ndarray
+            factorized feature, -1 for missing values
+        y : np.ndarray
+            a binary target variable
+        K : int
+            number of categories
+
+    Returns
+    -------
+        woe : np.ndarray
+            weight of evidence for each category
+        iv : np.ndarray
+            information value for each category
+        observed : np.ndarray
+            whether each category occurs at least once
+    """
+    pos = np.zeros(K, np.int64)
+    neg = np.zeros(K, np.int64)
+    for i in range(codes.size):
+        code = codes[i]
+        if code < 0:
+            continue
+        if y[i]:
+            pos[code] += 1
+        else:
+            neg[code] += 1
+    n1 = np.float32(pos.sum())
+    n0 = np.float32(neg.sum())
+    log_ratio = np.log(n1) - np.log(n0)
+    woe = np.empty(K, np.float32)
+    iv = np.empty(K, np.float32)
+    for k in range(K):
+        event = np.float32(pos[k] + _ZERO_ADJUSTMENT)
+        non_event = np.float32(neg[k] + _ZERO_ADJUSTMENT)
+        woe[k] = np.log(non_event) - np.log(event) + log_ratio
+        iv[k] = (non_event / n0 - event / n1) * woe[k]
+    observed = (pos + neg) > 0
+    return woe, iv, observed
 
 
 class WeightofEvidenceEncoder:
@@ -20,41 +132,91 @@ class WeightofEvidenceEncoder:
             prefix to add to the new columns
         suffix: str type, default=""
             suffix to add to the new columns
+        n_jobs: int type, default=None
+            number of threads to fit the features with.
+            None means 1 and -1 means using all processors
     """
 
-    def __init__(self, feats, drop_original=False, fillna=None, prefix="woe_", suffix=""):
+    def __init__(
+        self, feats, drop_original=False, fillna=None, prefix="woe_", suffix="", n_jobs=None
+    ):
         self.feats = feats
         self.drop_original = drop_original
         self.fillna = fillna
         self.prefix = prefix
         self.suffix = suffix
-        self.transform_dict = {"woe": {}, "iv": {}}
+        self.n_jobs = n_jobs
+        self.transform_dict = {"woe": {}, "iv": {}, "categories": {}, "woe_values": {}}
         self.is_fitted = False
 
     @staticmethod
-    def __calc_perc(x, y):
+    def __calc_perc(codes, y, K):
         """
         Calculates % of events and non events
 
         Parameters
         ----------
-            x : pd.Series
+            codes : np.ndarray
+                factorized feature, -1 for missing values
+            y : np.ndarray
+                a binary target variable
+            K : int
+                number of categories
+
+        Returns
+        -------
+            p_event : np.ndarray
+                % of events for each category, zero adjusted
+            p_non_event : np.ndarray
+                % of non events for each category, zero adjusted
+            observed : np.ndarray
+                whether each category occurs at least once
+        """
+        if codes.size and codes.min() < 0:
+            not_missing = codes >= 0
+            codes, y = codes[not_missing], y[not_missing]
+        counts = np.bincount(
+            codes + K * y.astype(codes.dtype), minlength=2 * K
+        ).reshape(2, K)
+        observed = counts.sum(axis=0) > 0
+        counts = counts.astype(np.float32)
+        p_event = (counts[1] + _ZERO_ADJUSTMENT) / counts[1].sum()
+        p_non_event = (counts[0] + _ZERO_ADJUSTMENT) / counts[0].sum()
+        return p_event, p_non_event, observed
+
+    def __fit_feature(self, feat, x, y):
+        """
+        Calculates weight of evidence and information value of a feature
+
+        Parameters
+        ----------
+            feat : str
+                name of the feature
+            x : np.ndarray
                 a feature variable
-            y : pd.Series
-                a target variable
+            y : np.ndarray
+                a binary target variable
 
         Returns
         -------
-            p_event : pd.Series
-                % of events
-            p_non_event : pd.Series
-                % of non events
+            feat : str
+                name of the feature
+            uniques : np.ndarray
+                categories of the feature, missing values excluded
+            woe : np.ndarray
+                weight of evidence for each category in `uniques`
+            information_value : np.ndarray
+                information value for each category in `uniques`
         """
-        X_temp = pd.DataFrame({"feat": x.values, "target": y.values})
-        n_event = y.value_counts()
-        p_event = X_temp.groupby("target")["feat"].value_counts()[1] / n_event[1]
-        p_non_event = X_temp.groupby("target")["feat"].value_counts()[0] / n_event[0]
-        return p_event, p_non_event
+        codes, uniques = _factorize(x)
+        if NUMBA_AVAILABLE:
+            woe, information_value, observed = _woe_iv_kernel(codes, y, len(uniques))
+        else:
+            p_event, p_non_event, observed = self.__calc_perc(codes, y, len(uniques))
+            woe = np.log(p_non_event) - np.log(p_event)
+            information_value = (p_non_event - p_event) * woe
+        # values of a narrow integer range that never occur are left to `fillna`
+        return feat, uniques[observed], woe[observed], information_value[observed]
 
     def fit(self, X, y):
         """
@@ -67,15 +229,16 @@ class WeightofEvidenceEncoder:
             y : pd.Series
                 a
         """
-        for feat in self.feats:
-            p_event, p_non_event = self.__calc_perc(X[feat], y)
-            woe = np.log(p_non_event / p_event)
-            woe.fillna(0, inplace=True)
-            self.transform_dict["woe"][feat] = woe.to_dict()
-            information_value = (p_non_event - p_event) * woe
-            if self.fillna is not None:
-                information_value.fillna(self.fillna, inplace=True)
+        y_arr = y.values.astype(np.int8)
+        results = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+            delayed(self.__fit_feature)(feat, X[feat].values, y_arr) for feat in self.feats
+        )
+        for feat, uniques, woe, information_value in results:
+            self.transform_dict["woe"][feat] = dict(zip(uniques.tolist(), woe.tolist()))
             self.transform_dict["iv"][feat] = information_value
+            # a Categorical would impose its sorted category order on the lookup
+            self.transform_dict["categories"][feat] = np.asarray(uniques)
+            self.transform_dict["woe_values"][feat] = np.asarray(woe, dtype=np.float64)
         self.is_fitted = True
 
     def transofrm(self, X):
@@ -92,41 +255,19 @@ class WeightofEvidenceEncoder:
                 Transformed input
         """
         assert self.is_fitted, "Fot the encoder first"
+        fill_value = np.nan if self.fillna is None else self.fillna
         for feat in self.feats:
             new_col_name = self.prefix + feat + self.suffix
-            X[new_col_name] = X[feat].map(
-                self.transform_dict["woe"][feat], na_action=self.fillna
-            )
-            if (self.drop_original is True) & (self.prefix + self.suffix != ""):
-                X.drop([feat], axis=1, inplace=True)
+            codes = pd.Categorical(
+                X[feat], categories=self.transform_dict["categories"][feat]
+            ).codes
+            # code -1 (missing or unseen) picks up the appended fill value
+            woe_values = np.append(self.transform_dict["woe_values"][feat], fill_value)
+            X[new_col_name] = woe_values[codes]
+        if self.drop_original and (self.prefix or self.suffix):
+            X.drop(self.feats, axis=1, inplace=True)
         return X
 
-    @staticmethod
-    def __add_description(information_value):
-        """
-        Convert Information Value to Description.
-
-        Parameters
-        ----------
-            information_value : float
-                Information Value
-        Returns
-        -------
-            desc: str type
-                Description of Information Value
-        """
-        predictive_power = {
-            (0, 0.02): "Not useful for prediction",
-            (0.02, 0.1): "Weak predictive power",
-            (0.1, 0.3): "Medium predictive power",
-            (0.3, 0.5): "Strong predictive power",
-            (0.5, np.inf): "Too good to be true!",
-        }
-        for bounds, desc in predictive_power.items():
-            if bounds[0] <= information_value < bounds[1]:
-                return desc
-        return "Too good to be true!"
-
     def information_values(self, add_description=True):
         """
         The information-value-based feature importances
@@ -150,8 +291,9 @@ class WeightofEvidenceEncoder:
         for feat in self.feats:
             X_iv.loc[feat, "Information Value"] = self.transform_dict["iv"][feat].sum()
         if add_description:
-            X_iv["Predictive Power Description"] = X_iv["Information Value"].apply(
-                self.__add_description
-            )
+            information_value = X_iv["Information Value"].to_numpy(dtype=np.float64)
+            X_iv["Predictive Power Description"] = _IV_DESCRIPTIONS[
+                np.searchsorted(_IV_BOUNDS, information_value, side="right")
+            ]
 
         return X_iv
@@ -32,17 +32,15 @@ class bin_continuous:
         self.drop_original = drop_original
         self.suffix = suffix
         self.params = params
-        self.transformers = {}
+        self.transformer = None
 
     def __initialize(self):
         """
         initialize the K Bins Discretizer from sklearn.
         Parameters is set by self.params
         """
-        for col in self.cols:
-            est = KBinsDiscretizer()
-            est.set_params(**self.params)
-            self.transformers[col] = est
+        self.transformer = KBinsDiscretizer()
+        self.transformer.set_params(**self.params)
 
     def fit(self, X, y=None):
         """
@@ -61,8 +59,7 @@ class bin_continuous:
             self
         """
         self.__initialize()
-        for col in self.cols:
-            self.transformers[col].fit(X[col].to_numpy().reshape(-1, 1))
+        self.transformer.fit(X[self.cols].to_numpy())
 
     def transform(self, X):
         """
@@ -78,20 +75,11 @@ class bin_continuous:
             X_out : a 2-d array
                 Transformed input.
         """
+        X_binned = self.transformer.transform(X[self.cols].to_numpy())
         if self.suffix is None:
-            for col in self.cols:
-                X[col] = (
-                    self.transformers[col]
-                    .transform(X[col].to_numpy().reshape(-1, 1))
-                    .reshape(1, -1)[0]
-                )
+            X[self.cols] = X_binned
         else:
-            for col in self.cols:
-                X[f"{col}_{self.suffix}"] = (
-                    self.transformers[col]
-                    .transform(X[col].to_numpy().reshape(-1, 1))
-                    .reshape(1, -1)[0]
-                )
-                if self.drop_original is True:
-                    X.drop(col, axis=1, inplace=True)
+            X[[f"{col}_{self.suffix}" for col in self.cols]] = X_binned
+            if self.drop_original is True:
+                X.drop(self.cols, axis=1, inplace=True)
         return X
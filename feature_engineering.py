@@ -1,4 +1,6 @@
+import numpy as np
 import pandas as pd
+from scipy import sparse
 from sklearn.preprocessing import OneHotEncoder, StandardScaler
 
 class Featurizer:
@@ -14,7 +16,10 @@ class Featurizer:
 
     Attributes:
         one_hot_encoders ():
-        label_encoding_dict ():
+        one_hot_feature_names ():
+        label_encoding_dict (dict): categories of every `label_encoder_columns` in order of
+            appearance. Label encoded columns hold int8/int16 codes into these categories,
+            and missing or unseen values are encoded as -1
         scalers ():
         nn_encoders ():
 
@@ -32,7 +37,7 @@ class Featurizer:
         self.drop_original = drop_original
 
         self.one_hot_encoders = None
-        self.label_encoders = None
+        self.one_hot_feature_names = None
         self.label_encoding_dict = {}
         self.scalers = None
         self.nn_encoders = None
@@ -45,6 +50,20 @@ class Featurizer:
         """
         self.one_hot_encoders = OneHotEncoder(handle_unknown='ignore')
         self.one_hot_encoders.fit(X[self.one_hot_columns])
+        self.one_hot_feature_names = list(
+            self.one_hot_encoders.get_feature_names_out(self.one_hot_columns)
+        )
+
+    def __encode_one_hot(self, X):
+        """
+        apply one hot encoders on every `one_hot_columns` without densifying the output
+        Args:
+            X (pd.DataFrame): dataset to apply one hot encoders on
+        Returns:
+            scipy.sparse.csr_matrix: one-hot features named by `one_hot_feature_names`
+        """
+        print("One Hot Encoding")
+        return self.one_hot_encoders.transform(X[self.one_hot_columns])
 
     def __transform_one_hot_encoders(self, X):
         """
@@ -54,16 +73,17 @@ class Featurizer:
         Returns:
             pd.DataFrame
         """
+        one_hot_encoded = self.__encode_one_hot(X).tocsc()
         X_one_hot_encoded = pd.DataFrame(
-            self.one_hot_encoders.transform(X[self.one_hot_columns]).toarray()
-            )
-        X_one_hot_encoded.columns = self.one_hot_encoders.get_feature_names(
-            self.one_hot_columns
+            {
+                feature_name: pd.arrays.SparseArray.from_spmatrix(one_hot_encoded[:, [i]])
+                for i, feature_name in enumerate(self.one_hot_feature_names)
+            },
+            index=X.index,
             )
-        X = X.merge(X_one_hot_encoded, left_index=True, right_index=True, how="inner")
         if self.drop_original is True:
-            X.drop(self.one_hot_columns, axis=1, inplace=True)
-        return X
+            X = X.drop(self.one_hot_columns, axis=1)
+        return pd.concat([X, X_one_hot_encoded], axis=1)
 
     def __fit_label_encoder(self, series):
         """
@@ -71,16 +91,9 @@ class Featurizer:
         Args:
             series (pd.Series): column to fit label encoder on
         """
-        col_name = series.name
-        self.label_encoding_dict[col_name] = {}
-        for i, value in enumerate(series.unique()):
-            self.label_encoding_dict[col_name][value] = i
-        def label_encoder(series):
-            col_name = series.name
-            series = series.map(self.label_encoding_dict[col_name])
-            series.fillna(-1, inplace=True)
-            return series
-        return label_encoder
+        _, uniques = pd.factorize(series.values)
+        # a Categorical would impose its sorted category order on the codes
+        self.label_encoding_dict[series.name] = np.asarray(uniques)
 
     def __fit_label_encoders(self, X):
         """
@@ -88,11 +101,9 @@ class Featurizer:
         Args:
             X (pd.DataFrame): dataset to fit label encoder on
         """
-        self.label_encoders = {}
+        self.label_encoding_dict = {}
         for label_encoder_column in self.label_encoder_columns:
-            self.label_encoders[label_encoder_column] = self.__fit_label_encoder(
-                X[label_encoder_column]
-            )
+            self.__fit_label_encoder(X[label_encoder_column])
 
     def __transform_label_encoder(self, series):
         """
@@ -100,9 +111,9 @@ class Featurizer:
         Args:
             series (pd.Series): column to apply label encoder on
         Returns:
-            pd.Series
+            np.ndarray: codes of the column, -1 for unseen or missing values
         """
-        return self.label_encoders[series.name](series)
+        return pd.Categorical(series, categories=self.label_encoding_dict[series.name]).codes
 
 
     def __transform_label_encoders(self, X):
@@ -132,7 +143,12 @@ class Featurizer:
         Args:
             X (pd.DataFrame): dataset to apply scaler on
         """
-        X[self.scaler_columns] = self.scalers.transform(X[self.scaler_columns])
+        X_scaled = self.scalers.transform(X[self.scaler_columns])
+        if (X.dtypes[self.scaler_columns] == X_scaled.dtype).all():
+            # write into the existing block(s) instead of re-inserting every column
+            X.loc[:, self.scaler_columns] = X_scaled
+        else:
+            X[self.scaler_columns] = X_scaled
         return X
 
 
@@ -142,33 +158,28 @@ class Featurizer:
         Args:
             X (pd.DataFrame): dataset to fit all the featurizer on
         """
-        X_copy = X.copy()
         if self.one_hot_columns is not None:
             print("Fitting One Hot Encoder")
-            self.__fit_one_hot_encoders(X_copy)
+            self.__fit_one_hot_encoders(X)
 
         if self.label_encoder_columns is not None:
             print("Fitting Label Encoder")
-            self.__fit_label_encoders(X_copy)
+            self.__fit_label_encoders(X)
 
         if self.scaler_columns is not None:
             print("Fitting Scaler")
-            self.__fit_scalers(X_copy)
+            self.__fit_scalers(X)
 
 
-    def transform(self, X):
+    def __transform_label_encoders_and_scalers(self, X):
         """
-        apply every featurized that was fit in `fit`
+        apply the label encoders and scaler that were fit in `fit`
         Args:
-            X (pd.DataFrame): dataset to apply featurizer on
+            X (pd.DataFrame): dataset to apply label encoders and scaler on
         Return:
             pd.DataFrame
         """
-        if self.one_hot_encoders is not None:
-            print("One Hot Encoding")
-            X = self.__transform_one_hot_encoders(X)
-
-        if self.label_encoders is not None:
+        if self.label_encoding_dict:
             print("Label Encoding")
             X = self.__transform_label_encoders(X)
 
@@ -177,3 +188,35 @@ class Featurizer:
             X = self.__transform_scalers(X)
 
         return X
+
+    def transform(self, X):
+        """
+        apply every featurized that was fit in `fit`
+        Args:
+            X (pd.DataFrame): dataset to apply featurizer on
+        Return:
+            pd.DataFrame
+        """
+        if self.one_hot_encoders is not None:
+            X = self.__transform_one_hot_encoders(X)
+
+        return self.__transform_label_encoders_and_scalers(X)
+
+    def transform_sparse(self, X):
+        """
+        apply every featurizer that was fit in `fit` while keeping one-hot features sparse,
+        X itself is left unchanged
+        Args:
+            X (pd.DataFrame): dataset to apply featurizer on, every column other than
+                `one_hot_columns` has to be numeric after label encoding
+        Return:
+            scipy.sparse.csr_matrix: the other columns of X followed by the one-hot features
+        """
+        # drop returns a new frame, so the label encoders and scaler do not write into X
+        X_numeric = X.drop(self.one_hot_columns or [], axis=1)
+        X_numeric = self.__transform_label_encoders_and_scalers(X_numeric)
+        X_numeric = sparse.csr_matrix(X_numeric.to_numpy(dtype=np.float64))
+        if self.one_hot_encoders is None:
+            return X_numeric
+
+        return sparse.hstack([X_numeric, self.__encode_one_hot(X)], format="csr")
@@ -9,5 +9,5 @@ setup(
         package_dir={"fe":"fe"},
         url="https://github.com/HirotakaNakagame/feature-enginerring/",
         license="MIT",
-        install_requires=[  "sklearn >= 0.24"]
+        install_requires=[  "scikit-learn >= 1.0", "joblib", "scipy"]
 )